@@ -1,42 +1,69 @@
-import operator
-from collections.abc import Iterable, Iterator
-from functools import reduce
+from collections.abc import Iterator, Mapping
 
 
 # ==================================================================================================
-def create_empty_dict_from_keys(input_dict: dict) -> dict:
-    def _create_empty_dict(d: dict) -> dict:
-        if isinstance(d, dict):
-            return {key: _create_empty_dict(value) for key, value in d.items()}
-        return None
-
-    return _create_empty_dict(input_dict)
+def create_empty_dict_from_keys(input_dict: Mapping) -> dict:
+    empty_dict = {}
+    stack = [(input_dict, empty_dict)]
+    while stack:
+        source_dict, target_dict = stack.pop()
+        for key, value in source_dict.items():
+            if isinstance(value, Mapping):
+                target_dict[key] = {}
+                stack.append((value, target_dict[key]))
+            else:
+                target_dict[key] = None
+    return empty_dict
 
 
 # --------------------------------------------------------------------------------------------------
-def get_dict_entry(key_sequence: Iterable[str], data_dict: dict) -> object:
+def get_dict_entry(key_sequence: tuple[str, ...], data_dict: Mapping) -> object:
+    value = data_dict
     try:
-        value = reduce(operator.getitem, key_sequence, data_dict)
+        for key in key_sequence:
+            value = value[key]
     except KeyError as e:
         raise KeyError(f"Key sequence {key_sequence} not found") from e
     return value
 
 
 # --------------------------------------------------------------------------------------------------
-def set_dict_entry(key_sequence: Iterable[str], data_dict: dict, value: object) -> None:
+def set_dict_entry(key_sequence: tuple[str, ...], data_dict: dict, value: object) -> None:
+    parent_dict = data_dict
     try:
-        reduce(operator.getitem, key_sequence[:-1], data_dict)[key_sequence[-1]] = value
+        for key in key_sequence[:-1]:
+            parent_dict = parent_dict[key]
+        parent_dict[key_sequence[-1]] = value
     except KeyError as e:
         raise KeyError(f"Key sequence {key_sequence} not found") from e
 
 
 # --------------------------------------------------------------------------------------------------
 def nested_dict_keys(
-    d: dict[str, dict], prefix: tuple[str, ...] = ()
+    d: Mapping[str, Mapping], prefix: tuple[str, ...] = ()
 ) -> Iterator[tuple[str, ...]]:
-    for key, value in d.items():
-        path = (*prefix, key)
-        if isinstance(value, dict):
-            yield from nested_dict_keys(value, path)
-        else:
+    stack = [(prefix, iter(d.items()))]
+    while stack:
+        current_prefix, items = stack[-1]
+        for key, value in items:
+            path = (*current_prefix, key)
+            if isinstance(value, Mapping):
+                stack.append((path, iter(value.items())))
+                break
             yield path
+        else:
+            stack.pop()
+
+
+# --------------------------------------------------------------------------------------------------
+def flatten_nested_dict(d: Mapping[str, Mapping]) -> dict[tuple[str, ...], object]:
+    return {key_sequence: get_dict_entry(key_sequence, d) for key_sequence in nested_dict_keys(d)}
+
+
+# --------------------------------------------------------------------------------------------------
+def get_flat_dict_entry(key_sequence: tuple[str, ...], flat_dict: dict) -> object:
+    try:
+        value = flat_dict[tuple(key_sequence)]
+    except KeyError as e:
+        raise KeyError(f"Key sequence {key_sequence} not found") from e
+    return value
@@ -14,11 +14,9 @@ def compute_mean_value_coordinates(
     interior_inds = np.setdiff1d(np.unique(simplices), boundary_inds)
     system_matrix_interior = system_matrix[np.ix_(interior_inds, interior_inds)]
     system_matrix_boundary = system_matrix[np.ix_(interior_inds, boundary_inds)]
-    rhs_vector_x = system_matrix_boundary @ boundary_coordinates[:, 0]
-    rhs_vector_y = system_matrix_boundary @ boundary_coordinates[:, 1]
-    uacs_interior_x = sps.linalg.spsolve(system_matrix_interior, -rhs_vector_x)
-    uacs_interior_y = sps.linalg.spsolve(system_matrix_interior, -rhs_vector_y)
-    uacs_interior = np.hstack([uacs_interior_x[:, None], uacs_interior_y[:, None]])
+    rhs_vectors = system_matrix_boundary @ boundary_coordinates
+    interior_factorization = sps.linalg.splu(system_matrix_interior.tocsc())
+    uacs_interior = interior_factorization.solve(-rhs_vectors)
     uacs = np.zeros((vertices.shape[0], 2))
     uacs[interior_inds] = uacs_interior
     uacs[boundary_inds] = boundary_coordinates
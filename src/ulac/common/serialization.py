@@ -4,7 +4,7 @@ from typing import Any
 import msgspec.msgpack
 import numpy as np
 
-from ulac.construction import internal
+from ulac.construction import datatypes
 
 
 def _np_array_enc_hook(obj: Any) -> Any:
@@ -19,9 +19,9 @@ def _np_array_dec_hook(type: type, obj: Any) -> Any:
     raise TypeError(f"Unsupported type: {type}")
 
 
-def _decode_recursively(data: dict, uac_submesh_attrs: frozenset[str]) -> dict | internal.UACSubmesh:
+def _decode_recursively(data: dict, uac_submesh_attrs: frozenset[str]) -> dict | datatypes.UACSubmesh:
     if data.keys() == uac_submesh_attrs:
-        return msgspec.convert(data, type=internal.UACSubmesh, dec_hook=_np_array_dec_hook)
+        return msgspec.convert(data, type=datatypes.UACSubmesh, dec_hook=_np_array_dec_hook)
     else:
         return {k: _decode_recursively(v, uac_submesh_attrs) for k, v in data.items()}
 
@@ -32,7 +32,7 @@ def encode_uac_submeshdata(data_dict: dict) -> bytes:
 
 def decode_uac_submeshdata(data: bytes) -> dict:
     raw_dict = msgspec.msgpack.decode(data)
-    uac_submesh_attrs = frozenset(f.name for f in dataclasses.fields(internal.UACSubmesh))
+    uac_submesh_attrs = frozenset(f.name for f in dataclasses.fields(datatypes.UACSubmesh))
     return _decode_recursively(raw_dict, uac_submesh_attrs)
 
 
@@ -41,6 +41,6 @@ def save_uac_submeshdata(path: str, submesh_dict: dict) -> None:
         f.write(encode_uac_submeshdata(submesh_dict))
 
 
-def load_uac_submeshdata(path: str) -> dict[str, internal.UACSubmesh]:
+def load_uac_submeshdata(path: str) -> dict[str, datatypes.UACSubmesh]:
     with open(path, "rb") as f:
         return decode_uac_submeshdata(f.read())
@@ -1,55 +1,138 @@
 from collections.abc import Iterable
 from dataclasses import dataclass
-from numbers import Real
+from enum import IntEnum
+from itertools import pairwise
 
 
 # ==================================================================================================
-@dataclass
+class PositionType(IntEnum):
+    INDEX = 0
+    RELATIVE = 1
+
+
+# ==================================================================================================
+@dataclass(slots=True, frozen=True)
 class MarkerConfig:
-    path: Iterable[str]
-    position_type: str
+    path: tuple[str, ...]
+    position_type: PositionType
     position: int | float
 
+    def __post_init__(self) -> None:
+        object.__setattr__(self, "path", tuple(self.path))
+        position_type = self.position_type
+        if isinstance(position_type, str):
+            try:
+                position_type = PositionType[position_type.upper()]
+            except KeyError as e:
+                raise ValueError(
+                    f"Unknown position_type {self.position_type!r}, "
+                    f"expected one of {[member.name.lower() for member in PositionType]}"
+                ) from e
+        object.__setattr__(self, "position_type", PositionType(position_type))
 
-@dataclass
+
+@dataclass(slots=True, frozen=True)
 class ParameterizationConfig:
-    path: Iterable[str]
-    markers: Iterable[Iterable[str]]
-    marker_relative_positions: Iterable[Real]
+    path: tuple[str, ...]
+    markers: tuple[tuple[str, ...], ...]
+    marker_relative_positions: tuple[float, ...]
+
+    def __post_init__(self) -> None:
+        object.__setattr__(self, "path", tuple(self.path))
+        object.__setattr__(self, "markers", tuple(tuple(marker) for marker in self.markers))
+        object.__setattr__(
+            self,
+            "marker_relative_positions",
+            tuple(float(value) for value in self.marker_relative_positions),
+        )
+        if not _is_strictly_increasing(self.marker_relative_positions):
+            raise ValueError(
+                f"Marker relative positions {self.marker_relative_positions} for path "
+                f"{self.path} are not strictly increasing"
+            )
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class BoundaryPathConfig:
     feature_tag: str
     coincides_with_mesh_boundary: bool
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class ConnectionPathConfig:
-    boundary_types: Iterable[str]
-    start: Iterable[str]
-    end: Iterable[str]
-    inadmissible_contact: Iterable[Iterable[str]]
-    inadmissible_along: Iterable[Iterable[str]]
+    boundary_types: tuple[str, ...]
+    start: tuple[str, ...]
+    end: tuple[str, ...]
+    inadmissible_contact: tuple[tuple[str, ...], ...] = ()
+    inadmissible_along: tuple[tuple[str, ...], ...] = ()
+
+    def __post_init__(self) -> None:
+        object.__setattr__(self, "boundary_types", tuple(self.boundary_types))
+        object.__setattr__(self, "start", tuple(self.start))
+        object.__setattr__(self, "end", tuple(self.end))
+        object.__setattr__(
+            self,
+            "inadmissible_contact",
+            tuple(tuple(path) for path in self.inadmissible_contact),
+        )
+        object.__setattr__(
+            self, "inadmissible_along", tuple(tuple(path) for path in self.inadmissible_along)
+        )
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class UACConfig:
-    path: Iterable[str]
-    relative_positions: Iterable[Real]
-    uacs: Iterable[tuple[float, float]]
+    path: tuple[str, ...]
+    relative_positions: tuple[float, ...]
+    uacs: tuple[tuple[float, float], ...]
 
+    def __post_init__(self) -> None:
+        object.__setattr__(self, "path", tuple(self.path))
+        object.__setattr__(
+            self, "relative_positions", tuple(float(value) for value in self.relative_positions)
+        )
+        object.__setattr__(
+            self, "uacs", tuple((float(alpha), float(beta)) for alpha, beta in self.uacs)
+        )
+        if not _is_strictly_increasing(self.relative_positions):
+            raise ValueError(
+                f"Relative positions {self.relative_positions} for path {self.path} "
+                "are not strictly increasing"
+            )
 
-@dataclass
+
+@dataclass(slots=True, frozen=True)
 class SubmeshConfig:
-    boundary_paths: Iterable[Iterable[str]]
-    portions: Iterable[tuple[Real]]
-    outside_path: Iterable[str]
+    boundary_paths: tuple[tuple[str, ...], ...]
+    portions: tuple[tuple[float, float], ...]
+    outside_path: tuple[str, ...]
+
+    def __post_init__(self) -> None:
+        object.__setattr__(
+            self, "boundary_paths", tuple(tuple(path) for path in self.boundary_paths)
+        )
+        object.__setattr__(
+            self, "portions", tuple((float(start), float(end)) for start, end in self.portions)
+        )
+        if len(self.boundary_paths) != len(self.portions):
+            raise ValueError(
+                f"Number of portions {len(self.portions)} does not match number of "
+                f"boundary paths {len(self.boundary_paths)}"
+            )
+        for path, (start, end) in zip(self.boundary_paths, self.portions, strict=True):
+            if start > end:
+                raise ValueError(f"Portion ({start}, {end}) for path {path} has start after end")
+        object.__setattr__(self, "outside_path", tuple(self.outside_path))
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class Step:
     id: str
     type: str
     description: str
     apply_to: str | Iterable[str | Iterable[str]]
+
+
+# ==================================================================================================
+def _is_strictly_increasing(values: tuple[float, ...]) -> bool:
+    return all(first < second for first, second in pairwise(values))
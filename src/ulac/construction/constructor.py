@@ -1,4 +1,7 @@
-from collections.abc import Iterable
+import logging
+import os
+from collections.abc import Iterable, Mapping, Sequence
+from concurrent.futures import ProcessPoolExecutor
 from dataclasses import dataclass, fields
 
 import numpy as np
@@ -6,28 +9,30 @@ import pyvista as pv
 
 from ulac.common import dict_utils, mvc
 
-from . import configuration, internal
+from . import configuration, datatypes, internal
+
+logger = logging.getLogger(__name__)
 
 # ==================================================================================================
 type MarkerDict = dict[str, "MarkerDict" | int]
 type PathDict = dict[str, "PathDict" | np.ndarray[tuple[int], np.dtype[np.float64]]]
-type ParameterizedPathDict = dict[str, "ParameterizedPathDict" | internal.ParameterizedPath]
-type UACPathDict = dict[str, "UACPathDict" | internal.UACPath]
+type ParameterizedPathDict = dict[str, "ParameterizedPathDict" | datatypes.ParameterizedPath]
+type UACPathDict = dict[str, "UACPathDict" | datatypes.UACPath]
 type SubmeshBoundaryDict = dict[
     str, "SubmeshBoundaryDict" | np.ndarray[tuple[int], np.dtype[np.int64]]
 ]
 type SubmeshDict = dict[str, "SubmeshDict" | pv.PolyData]
-type UACSubmeshDict = dict[str, "UACSubmeshDict" | internal.UACSubmesh]
+type UACSubmeshDict = dict[str, "UACSubmeshDict" | datatypes.UACSubmesh]
 
-type PathConfigDict = dict[
+type PathConfigDict = Mapping[
     str, "PathConfigDict" | configuration.BoundaryPathConfig | configuration.ConnectionPathConfig
 ]
-type MarkerConfigDict = dict[str, "MarkerConfigDict" | configuration.MarkerConfig]
-type ParameterizationConfigDict = dict[
+type MarkerConfigDict = Mapping[str, "MarkerConfigDict" | configuration.MarkerConfig]
+type ParameterizationConfigDict = Mapping[
     str, "ParameterizationConfigDict" | configuration.ParameterizationConfig
 ]
-type UACConfigDict = dict[str, "UACConfigDict" | configuration.UACConfig]
-type SubmeshConfigDict = dict[str, "SubmeshConfigDict" | configuration.SubmeshConfig]
+type UACConfigDict = Mapping[str, "UACConfigDict" | configuration.UACConfig]
+type SubmeshConfigDict = Mapping[str, "SubmeshConfigDict" | configuration.SubmeshConfig]
 type AnyDict = (
     MarkerDict
     | PathDict
@@ -47,6 +52,32 @@ def print_with_underline(text: str) -> None:
     print("-" * len(text))
 
 
+# --------------------------------------------------------------------------------------------------
+def _compute_uac_submesh(
+    vertices: np.ndarray, submesh: datatypes.Submesh, submesh_boundary: datatypes.UACPath
+) -> datatypes.UACSubmesh:
+    simplices = submesh.connectivity
+    vertex_order = np.argsort(submesh.vertex_inds)
+    sorted_vertex_inds = submesh.vertex_inds[vertex_order]
+    sorted_positions = np.searchsorted(sorted_vertex_inds, submesh_boundary.inds)
+    sorted_positions = np.minimum(sorted_positions, sorted_vertex_inds.size - 1)
+    if not np.array_equal(sorted_vertex_inds[sorted_positions], submesh_boundary.inds):
+        raise ValueError("Submesh boundary contains vertices that are not part of the submesh.")
+    boundary_inds = vertex_order[sorted_positions]
+    uac_coordinates = np.hstack((submesh_boundary.alpha[:, None], submesh_boundary.beta[:, None]))
+    mvc_map = mvc.compute_mean_value_coordinates(
+        vertices, simplices, boundary_inds, uac_coordinates
+    )
+    uac_submesh = datatypes.UACSubmesh(
+        vertex_inds=submesh.vertex_inds,
+        connectivity=simplices,
+        cell_inds=submesh.cell_inds,
+        alpha=mvc_map[:, 0],
+        beta=mvc_map[:, 1],
+    )
+    return uac_submesh
+
+
 # ==================================================================================================
 @dataclass
 class UACConstructorSettings:
@@ -57,7 +88,8 @@ class UACConstructorSettings:
     parameterization_config: ParameterizationConfigDict
     uac_config: UACConfigDict
     submesh_config: SubmeshConfigDict
-    segmentation_workflow: Iterable[configuration.Step]
+    segmentation_workflow: Sequence[configuration.Step]
+    num_workers: int | None = 1
 
 
 @dataclass
@@ -81,7 +113,50 @@ class UACConstructor:
         self._parameterization_config = settings.parameterization_config
         self._uac_config = settings.uac_config
         self._submesh_config = settings.submesh_config
-        self._segmentation_workflow = settings.segmentation_workflow
+        self._segmentation_workflow = tuple(settings.segmentation_workflow)
+        self._num_workers = settings.num_workers
+        if self._num_workers is not None and self._num_workers < 1:
+            raise ValueError(f"num_workers must be at least 1 or None, got {self._num_workers}")
+        if self._num_workers is None:
+            self._num_workers = os.cpu_count() or 1
+        self._mesh_topology = None
+        self._marker_getters = {
+            configuration.PositionType.INDEX: self._get_marker_from_index,
+            configuration.PositionType.RELATIVE: self._get_marker_from_relative_position,
+        }
+        self._boundary_set_getters = {
+            "path": self._get_path_boundary_set,
+            "marker": self._get_marker_boundary_set,
+        }
+
+        self._flat_path_config = dict_utils.flatten_nested_dict(settings.path_config)
+        self._flat_marker_config = dict_utils.flatten_nested_dict(settings.marker_config)
+        self._flat_parameterization_config = dict_utils.flatten_nested_dict(
+            settings.parameterization_config
+        )
+        self._flat_uac_config = dict_utils.flatten_nested_dict(settings.uac_config)
+        self._flat_submesh_config = dict_utils.flatten_nested_dict(settings.submesh_config)
+        self._validate_path_config_references()
+        self._marker_value_arrays = {
+            key_sequence: np.asarray(param_config.marker_relative_positions, dtype=np.float64)
+            for key_sequence, param_config in self._flat_parameterization_config.items()
+        }
+        self._uac_config_arrays = {
+            key_sequence: (
+                np.asarray(uac_config.relative_positions, dtype=np.float64),
+                np.asarray(uac_config.uacs, dtype=np.float64).reshape(-1, 2),
+            )
+            for key_sequence, uac_config in self._flat_uac_config.items()
+        }
+        self._step_dispatch = {
+            "feature_extraction": (self._extract_features, self._flat_path_config),
+            "marker_extraction": (self._extract_markers, self._flat_marker_config),
+            "shortest_path_construction": (self._construct_shortest_paths, self._flat_path_config),
+            "path_parameterization": (
+                self._parameterize_paths,
+                self._flat_parameterization_config,
+            ),
+        }
 
         self._marker_data = dict_utils.create_empty_dict_from_keys(settings.marker_config)
         self._raw_path_data = dict_utils.create_empty_dict_from_keys(settings.path_config)
@@ -89,26 +164,53 @@ class UACConstructor:
             settings.parameterization_config
         )
         self._uac_path_data = dict_utils.create_empty_dict_from_keys(settings.uac_config)
-        self._submesh_boundary_data = dict_utils.create_empty_dict_from_keys(settings.submesh_config)
+        self._submesh_boundary_data = dict_utils.create_empty_dict_from_keys(
+            settings.submesh_config
+        )
         self._submesh_data = dict_utils.create_empty_dict_from_keys(settings.submesh_config)
         self._uac_submesh_data = dict_utils.create_empty_dict_from_keys(settings.submesh_config)
 
+    # ----------------------------------------------------------------------------------------------
+    def _validate_path_config_references(self) -> None:
+        for key_sequence, path_config in self._flat_path_config.items():
+            if not isinstance(path_config, configuration.ConnectionPathConfig):
+                continue
+            for boundary_type, boundary_id in zip(
+                path_config.boundary_types, (path_config.start, path_config.end), strict=True
+            ):
+                if boundary_type not in self._boundary_set_getters:
+                    raise ValueError(
+                        f"Unknown boundary type {boundary_type} for path {key_sequence}"
+                    )
+                referenced_config = (
+                    self._flat_marker_config
+                    if boundary_type == "marker"
+                    else self._flat_path_config
+                )
+                if boundary_id not in referenced_config:
+                    raise KeyError(
+                        f"Boundary {boundary_id} for path {key_sequence} not found in config"
+                    )
+            for subset_id in (*path_config.inadmissible_contact, *path_config.inadmissible_along):
+                if subset_id not in self._flat_path_config:
+                    raise KeyError(
+                        f"Inadmissible path {subset_id} for path {key_sequence} not found in config"
+                    )
+
     # ----------------------------------------------------------------------------------------------
     def construct_segmentation(self) -> None:
         print("Starting Segmentation")
         print("=====================\n\n")
 
+        num_steps = len(self._segmentation_workflow)
         for i, step in enumerate(self._segmentation_workflow):
-            print_with_underline(f"Step {i + 1}/{len(self._segmentation_workflow)}: {step.id}")
-            match step.type:
-                case "feature_extraction":
-                    self._extract_features(step.apply_to)
-                case "marker_extraction":
-                    self._extract_markers(step.apply_to)
-                case "shortest_path_construction":
-                    self._construct_shortest_paths(step.apply_to)
-                case "path_parameterization":
-                    self._parameterize_paths(step.apply_to)
+            print_with_underline(f"Step {i + 1}/{num_steps}: {step.id}")
+            try:
+                run_step, flat_config = self._step_dispatch[step.type]
+            except KeyError as e:
+                raise ValueError(f"Unknown step type {step.type} for step {step.id}") from e
+            key_sequences = flat_config.keys() if step.apply_to == "all" else step.apply_to
+            run_step(key_sequences)
             print(" ")
 
     # ----------------------------------------------------------------------------------------------
@@ -161,141 +263,162 @@ class UACConstructor:
                 setattr(self, class_attr, input_data)
 
     # ----------------------------------------------------------------------------------------------
-    def _extract_features(self, apply_to: str | Iterable[str]) -> None:
-        key_sequences = dict_utils.nested_dict_keys(self._path_config) if apply_to == "all" else apply_to
+    def _get_mesh_topology(self) -> datatypes.MeshTopology:
+        if self._mesh_topology is None:
+            self._mesh_topology = internal.get_mesh_topology(self._mesh)
+        return self._mesh_topology
+
+    # ----------------------------------------------------------------------------------------------
+    def _extract_features(self, key_sequences: Iterable[tuple[str, ...]]) -> None:
+        geometry_boundary_inds = internal.get_geometry_boundary(self._mesh)
         for key_sequence in key_sequences:
             try:
-                path_config = dict_utils.get_dict_entry(key_sequence, self._path_config)
+                path_config = dict_utils.get_flat_dict_entry(key_sequence, self._flat_path_config)
             except KeyError as e:
                 raise KeyError(f"Key sequence {key_sequence} not found in path_config") from e
             if not isinstance(path_config, configuration.BoundaryPathConfig):
                 continue
-            print(f"Extracting Feature: {key_sequence}")
+            logger.debug("Extracting Feature: %s", key_sequence)
             tag_value = self._feature_tags[path_config.feature_tag]
             is_mesh_boundary = path_config.coincides_with_mesh_boundary
-            boundary_path = internal.get_feature_boundary(self._mesh, tag_value, is_mesh_boundary)
+            boundary_path = internal.get_feature_boundary(
+                self._mesh,
+                tag_value,
+                is_mesh_boundary,
+                geometry_boundary_inds,
+                mesh_topology=self._get_mesh_topology(),
+            )
             dict_utils.set_dict_entry(key_sequence, self._raw_path_data, boundary_path)
 
     # ----------------------------------------------------------------------------------------------
-    def _extract_markers(self, apply_to: str | Iterable[str]) -> None:
-        key_sequences = dict_utils.nested_dict_keys(self._marker_config) if apply_to == "all" else apply_to
+    def _extract_markers(self, key_sequences: Iterable[tuple[str, ...]]) -> None:
         for key_sequence in key_sequences:
-            marker_config = dict_utils.get_dict_entry(key_sequence, self._marker_config)
-            print(f"Extracting Marker: {key_sequence}")
+            marker_config = dict_utils.get_flat_dict_entry(key_sequence, self._flat_marker_config)
+            logger.debug("Extracting Marker: %s", key_sequence)
 
-            # Get marker from index in raw path
-            if marker_config.position_type == "index":
-                containing_path = dict_utils.get_dict_entry(marker_config.path, self._raw_path_data)
-                if not isinstance(containing_path, np.ndarray):
-                    raise ValueError(
-                        f"Raw path {marker_config.path} for marker "
-                        f"{key_sequence} has not been constructed yet."
-                    )
-                try:
-                    marker_ind = containing_path[marker_config.position]
-                except IndexError as e:
-                    raise IndexError(
-                        f"Index {marker_config.position} out of bounds for path "
-                        f"{marker_config.path} with length {len(containing_path)}"
-                    ) from e
-
-            # Get marker from relative position in parameterized path
-            elif marker_config.position_type == "relative":
-                containing_path = dict_utils.get_dict_entry(marker_config.path, self._parameterized_path_data)
-                if not isinstance(containing_path, internal.ParameterizedPath):
-                    raise TypeError(
-                        f"Parameterized path {marker_config.path} for marker "
-                        f"{key_sequence} has not been constructed yet."
-                    )
-                try:
-                    relative_marker_ind = np.where(
-                        containing_path.relative_lengths >= marker_config.position
-                    )[0][0]
-                    marker_ind = containing_path.inds[relative_marker_ind]
-                except IndexError as e:
-                    raise ValueError(
-                        f"Relative position {marker_config.position} not found on path "
-                        f"{marker_config.path}"
-                    ) from e
-            else:
+            # Get marker from index in raw path or relative position in parameterized path
+            try:
+                get_marker = self._marker_getters[marker_config.position_type]
+            except KeyError as e:
                 raise ValueError(
                     f"Unknown position_type {marker_config.position_type} for marker {key_sequence}"
-                )
+                ) from e
+            marker_ind = get_marker(marker_config, key_sequence)
 
             # Set marker
             dict_utils.set_dict_entry(key_sequence, self._marker_data, int(marker_ind))
 
     # ----------------------------------------------------------------------------------------------
-    def _construct_shortest_paths(self, apply_to: str | Iterable[str]) -> None:
-        key_sequences = dict_utils.nested_dict_keys(self._path_config) if apply_to == "all" else apply_to
+    def _get_marker_from_index(
+        self, marker_config: configuration.MarkerConfig, key_sequence: tuple[str, ...]
+    ) -> int:
+        containing_path = dict_utils.get_dict_entry(marker_config.path, self._raw_path_data)
+        if not isinstance(containing_path, np.ndarray):
+            raise TypeError(
+                f"Raw path {marker_config.path} for marker "
+                f"{key_sequence} has not been constructed yet."
+            )
+        try:
+            marker_ind = containing_path[marker_config.position]
+        except IndexError as e:
+            raise IndexError(
+                f"Index {marker_config.position} out of bounds for path "
+                f"{marker_config.path} with length {len(containing_path)}"
+            ) from e
+        return marker_ind
+
+    # ----------------------------------------------------------------------------------------------
+    def _get_marker_from_relative_position(
+        self, marker_config: configuration.MarkerConfig, key_sequence: tuple[str, ...]
+    ) -> int:
+        containing_path = dict_utils.get_dict_entry(
+            marker_config.path, self._parameterized_path_data
+        )
+        if not isinstance(containing_path, datatypes.ParameterizedPath):
+            raise TypeError(
+                f"Parameterized path {marker_config.path} for marker "
+                f"{key_sequence} has not been constructed yet."
+            )
+        relative_marker_ind = np.searchsorted(
+            containing_path.relative_lengths, marker_config.position, side="left"
+        )
+        if relative_marker_ind >= containing_path.relative_lengths.size:
+            raise ValueError(
+                f"Relative position {marker_config.position} not found on path "
+                f"{marker_config.path}"
+            )
+        marker_ind = containing_path.inds[relative_marker_ind]
+        return marker_ind
+
+    # ----------------------------------------------------------------------------------------------
+    def _construct_shortest_paths(self, key_sequences: Iterable[tuple[str, ...]]) -> None:
         for key_sequence in key_sequences:
-            path_config = dict_utils.get_dict_entry(key_sequence, self._path_config)
+            path_config = dict_utils.get_flat_dict_entry(key_sequence, self._flat_path_config)
             if not isinstance(path_config, configuration.ConnectionPathConfig):
                 continue
-            print(f"Constructing Shortest Path: {key_sequence}")
+            logger.debug("Constructing Shortest Path: %s", key_sequence)
             boundaries = []
 
             # Get boundary sets
             for boundary_type, boundary_id in zip(
                 path_config.boundary_types, (path_config.start, path_config.end), strict=True
             ):
-                # Option 1: Boundary set is a raw path
-                if boundary_type == "path":
-                    boundary_path = dict_utils.get_dict_entry(boundary_id, self._raw_path_data)
-                    if not isinstance(boundary_path, np.ndarray):
-                        raise ValueError(
-                            f"Raw path {boundary_id} for path {key_sequence} has not been "
-                            "constructed yet."
-                        )
-                # Option 2: Boundary set is a marker
-                elif boundary_type == "marker":
-                    boundary_marker = dict_utils.get_dict_entry(boundary_id, self._marker_data)
-                    if not isinstance(boundary_marker, int):
-                        raise ValueError(
-                            f"Marker {boundary_id} for path {key_sequence} has not been "
-                            "constructed yet."
-                        )
-                    boundary_path = np.array((boundary_marker,), dtype=int)
-                else:
-                    raise ValueError(
-                        f"Unknown boundary type {boundary_type} for path {key_sequence}"
-                    )
+                get_boundary_set = self._boundary_set_getters[boundary_type]
+                boundary_path = get_boundary_set(boundary_id, key_sequence)
                 boundaries.append(boundary_path)
 
             # Get inadmissible sets
             inadmissible_sets = []
             for inadmissible in (path_config.inadmissible_contact, path_config.inadmissible_along):
-                if inadmissible is None:
-                    subset = np.array([], dtype=int)
-                else:
-                    subsets = []
-                    for subset_id in inadmissible:
-                        subset_path = dict_utils.get_dict_entry(subset_id, self._raw_path_data)
-                        if not isinstance(subset_path, np.ndarray):
-                            raise TypeError(
-                                f"Raw path {subset_id} for path {key_sequence} has not been "
-                                "constructed yet."
-                            )
-                        subsets.append(subset_path)
-                    subset = np.unique(np.concatenate(subsets))
-                inadmissible_sets.append(subset)
+                subsets = [np.array([], dtype=int)]
+                for subset_id in inadmissible:
+                    subset_path = dict_utils.get_dict_entry(subset_id, self._raw_path_data)
+                    if not isinstance(subset_path, np.ndarray):
+                        raise TypeError(
+                            f"Raw path {subset_id} for path {key_sequence} has not been "
+                            "constructed yet."
+                        )
+                    subsets.append(subset_path)
+                inadmissible_sets.append(np.unique(np.concatenate(subsets)))
 
             # Compute shortest Path
             shortest_path = internal.construct_shortest_path_between_subsets(
                 self._mesh,
                 *boundaries,
                 *inadmissible_sets,
+                mesh_topology=self._get_mesh_topology(),
             )
             dict_utils.set_dict_entry(key_sequence, self._raw_path_data, shortest_path)
 
     # ----------------------------------------------------------------------------------------------
-    def _parameterize_paths(self, apply_to: str | Iterable[str]) -> None:
-        key_sequences = (
-            dict_utils.nested_dict_keys(self._parameterization_config) if apply_to == "all" else apply_to
-        )
+    def _get_path_boundary_set(
+        self, boundary_id: tuple[str, ...], key_sequence: tuple[str, ...]
+    ) -> np.ndarray:
+        boundary_path = dict_utils.get_dict_entry(boundary_id, self._raw_path_data)
+        if not isinstance(boundary_path, np.ndarray):
+            raise TypeError(
+                f"Raw path {boundary_id} for path {key_sequence} has not been constructed yet."
+            )
+        return boundary_path
+
+    # ----------------------------------------------------------------------------------------------
+    def _get_marker_boundary_set(
+        self, boundary_id: tuple[str, ...], key_sequence: tuple[str, ...]
+    ) -> np.ndarray:
+        boundary_marker = dict_utils.get_dict_entry(boundary_id, self._marker_data)
+        if not isinstance(boundary_marker, int):
+            raise TypeError(
+                f"Marker {boundary_id} for path {key_sequence} has not been constructed yet."
+            )
+        return np.array((boundary_marker,), dtype=int)
+
+    # ----------------------------------------------------------------------------------------------
+    def _parameterize_paths(self, key_sequences: Iterable[tuple[str, ...]]) -> None:
         for key_sequence in key_sequences:
-            param_config = dict_utils.get_dict_entry(key_sequence, self._parameterization_config)
-            print(f"Parameterizing Path: {key_sequence}")
+            param_config = dict_utils.get_flat_dict_entry(
+                key_sequence, self._flat_parameterization_config
+            )
+            logger.debug("Parameterizing Path: %s", key_sequence)
 
             # Get raw path
             path = dict_utils.get_dict_entry(param_config.path, self._raw_path_data)
@@ -319,28 +442,29 @@ class UACConstructor:
                 self._mesh,
                 path,
                 marker_inds,
-                param_config.marker_relative_positions,
+                self._marker_value_arrays[tuple(key_sequence)],
+            )
+            dict_utils.set_dict_entry(
+                key_sequence, self._parameterized_path_data, parameterized_path
             )
-            dict_utils.set_dict_entry(key_sequence, self._parameterized_path_data, parameterized_path)
 
     # ----------------------------------------------------------------------------------------------
     def _construct_uac_paths(self) -> None:
-        key_sequences = dict_utils.nested_dict_keys(self._uac_config)
-        for key_sequence in key_sequences:
-            uac_config = dict_utils.get_dict_entry(key_sequence, self._uac_config)
-            print(f"Constructing UACs for Path: {key_sequence}")
+        for key_sequence, uac_config in self._flat_uac_config.items():
+            logger.debug("Constructing UACs for Path: %s", key_sequence)
 
             # Get parameterized path
-            parameterized_path = dict_utils.get_dict_entry(uac_config.path, self._parameterized_path_data)
-            if not isinstance(parameterized_path, internal.ParameterizedPath):
+            parameterized_path = dict_utils.get_dict_entry(
+                uac_config.path, self._parameterized_path_data
+            )
+            if not isinstance(parameterized_path, datatypes.ParameterizedPath):
                 raise TypeError(
                     f"Parameterized path {key_sequence} for UAC construction has not been "
                     "constructed yet."
                 )
 
             # Get uac config data
-            relative_positions = uac_config.relative_positions
-            uacs = uac_config.uacs
+            relative_positions, uacs = self._uac_config_arrays[key_sequence]
 
             # Compute UACs
             uac_path = internal.compute_uacs_polyline(parameterized_path, relative_positions, uacs)
@@ -348,10 +472,8 @@ class UACConstructor:
 
     # ----------------------------------------------------------------------------------------------
     def _extract_submesh_boundaries(self) -> None:
-        key_sequences = dict_utils.nested_dict_keys(self._submesh_config)
-        for key_sequence in key_sequences:
-            submesh_config = dict_utils.get_dict_entry(key_sequence, self._submesh_config)
-            print(f"Extracting boundaries for Submesh: {key_sequence}")
+        for key_sequence, submesh_config in self._flat_submesh_config.items():
+            logger.debug("Extracting boundaries for Submesh: %s", key_sequence)
 
             boundary_inds = []
             boundary_alpha = []
@@ -360,23 +482,20 @@ class UACConstructor:
                 submesh_config.boundary_paths, submesh_config.portions, strict=True
             ):
                 uac_path = dict_utils.get_dict_entry(path, self._uac_path_data)
-                if not isinstance(uac_path, internal.UACPath):
+                if not isinstance(uac_path, datatypes.UACPath):
                     raise TypeError(
                         f"UAC path {uac_path} for submesh {key_sequence} "
                         "has not been constructed yet."
                     )
-                relevant_section = np.where(
-                    (uac_path.relative_lengths >= portion[0])
-                    & (uac_path.relative_lengths <= portion[1])
-                )[0]
-                boundary_inds.append(uac_path.inds[relevant_section])
-                boundary_alpha.append(uac_path.alpha[relevant_section])
-                boundary_beta.append(uac_path.beta[relevant_section])
+                uac_path_portion = internal.extract_uac_path_portion(uac_path, portion)
+                boundary_inds.append(uac_path_portion.inds)
+                boundary_alpha.append(uac_path_portion.alpha)
+                boundary_beta.append(uac_path_portion.beta)
 
             unique_inds, unique_alpha, unique_beta = self._concatenate_submesh_boundaries(
                 boundary_inds, boundary_alpha, boundary_beta
             )
-            submesh_boundary = internal.UACPath(
+            submesh_boundary = datatypes.UACPath(
                 inds=unique_inds, alpha=unique_alpha, beta=unique_beta
             )
             dict_utils.set_dict_entry(key_sequence, self._submesh_boundary_data, submesh_boundary)
@@ -387,30 +506,40 @@ class UACConstructor:
         boundary_inds: list[np.ndarray],
         boundary_alpha: list[np.ndarray],
         boundary_beta: list[np.ndarray],
-    ) -> None:
-        unique_inds = boundary_inds.pop(0)
-        unique_alpha = boundary_alpha.pop(0)
-        unique_beta = boundary_beta.pop(0)
-
-        current_end_point = unique_inds[-1]
-        while boundary_inds:
-            for i, inds in enumerate(boundary_inds):
-                if current_end_point in inds:
-                    next_segment_inds = boundary_inds.pop(i)
-                    next_segment_alpha = boundary_alpha.pop(i)
-                    next_segment_beta = boundary_beta.pop(i)
+    ) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+        segments_by_end_point = {}
+        for i, inds in enumerate(boundary_inds[1:], start=1):
+            segments_by_end_point.setdefault(inds[0], []).append(i)
+            segments_by_end_point.setdefault(inds[-1], []).append(i)
+        is_used = np.zeros(len(boundary_inds), dtype=bool)
+        is_used[0] = True
+
+        inds_parts = [boundary_inds[0]]
+        alpha_parts = [boundary_alpha[0]]
+        beta_parts = [boundary_beta[0]]
+        current_end_point = boundary_inds[0][-1]
+        for _ in range(len(boundary_inds) - 1):
+            for i in segments_by_end_point.get(current_end_point, []):
+                if not is_used[i]:
                     break
             else:
                 raise ValueError("Submesh boundary segments do not form a closed loop.")
+            is_used[i] = True
+            next_segment_inds = boundary_inds[i]
+            next_segment_alpha = boundary_alpha[i]
+            next_segment_beta = boundary_beta[i]
             if current_end_point == next_segment_inds[-1]:
                 next_segment_inds = next_segment_inds[::-1]
                 next_segment_alpha = next_segment_alpha[::-1]
                 next_segment_beta = next_segment_beta[::-1]
-            unique_inds = np.append(unique_inds, next_segment_inds[1:])
-            unique_alpha = np.append(unique_alpha, next_segment_alpha[1:])
-            unique_beta = np.append(unique_beta, next_segment_beta[1:])
-            current_end_point = unique_inds[-1]
-
+            inds_parts.append(next_segment_inds[1:])
+            alpha_parts.append(next_segment_alpha[1:])
+            beta_parts.append(next_segment_beta[1:])
+            current_end_point = next_segment_inds[-1]
+
+        unique_inds = np.concatenate(inds_parts)
+        unique_alpha = np.concatenate(alpha_parts)
+        unique_beta = np.concatenate(beta_parts)
         if unique_inds[0] == unique_inds[-1]:
             unique_inds = unique_inds[:-1]
             unique_alpha = unique_alpha[:-1]
@@ -419,18 +548,18 @@ class UACConstructor:
 
     # ----------------------------------------------------------------------------------------------
     def _extract_submeshes(self) -> None:
-        key_sequences = dict_utils.nested_dict_keys(self._submesh_config)
-        for key_sequence in key_sequences:
-            submesh_config = dict_utils.get_dict_entry(key_sequence, self._submesh_config)
-            print(f"Extracting Submesh: {key_sequence}")
+        for key_sequence, submesh_config in self._flat_submesh_config.items():
+            logger.debug("Extracting Submesh: %s", key_sequence)
 
             # Get boundary path
             submesh_boundary = dict_utils.get_dict_entry(key_sequence, self._submesh_boundary_data)
-            if not isinstance(submesh_boundary, internal.UACPath):
+            if not isinstance(submesh_boundary, datatypes.UACPath):
                 raise TypeError(f"Submesh boundary {key_sequence} has not been constructed yet.")
 
             # Get outside path
-            outside_path = dict_utils.get_dict_entry(submesh_config.outside_path, self._raw_path_data)
+            outside_path = dict_utils.get_dict_entry(
+                submesh_config.outside_path, self._raw_path_data
+            )
             if not isinstance(outside_path, np.ndarray):
                 raise TypeError(
                     f"Outside path {submesh_config.outside_path} for submesh "
@@ -439,43 +568,48 @@ class UACConstructor:
 
             # Extract submesh
             submesh = internal.extract_region_from_boundary(
-                self._mesh, submesh_boundary.inds, outside_path
+                self._mesh,
+                submesh_boundary.inds,
+                outside_path,
+                mesh_topology=self._get_mesh_topology(),
             )
             dict_utils.set_dict_entry(key_sequence, self._submesh_data, submesh)
 
     # ----------------------------------------------------------------------------------------------
     def _compute_uacs_on_submeshes(self) -> None:
-        key_sequences = dict_utils.nested_dict_keys(self._submesh_config)
-        for key_sequence in key_sequences:
-            print(f"Compute UACs for submesh: {key_sequence}")
+        points = np.ascontiguousarray(self._mesh.points, dtype=np.float64)
+        submesh_inputs = {}
+        for key_sequence in self._flat_submesh_config:
+            logger.debug("Compute UACs for submesh: %s", key_sequence)
 
             # Get boundary path
             submesh_boundary = dict_utils.get_dict_entry(key_sequence, self._submesh_boundary_data)
-            if not isinstance(submesh_boundary, internal.UACPath):
+            if not isinstance(submesh_boundary, datatypes.UACPath):
                 raise TypeError(f"Submesh boundary {key_sequence} has not been constructed yet.")
 
             # Get submesh
             submesh = dict_utils.get_dict_entry(key_sequence, self._submesh_data)
-            if not isinstance(submesh, internal.Submesh):
+            if not isinstance(submesh, datatypes.Submesh):
                 raise TypeError(f"Submesh {key_sequence} has not been extracted yet.")
 
-            # Compute UACs
-            vertices = np.array(self._mesh.points[submesh.vertex_inds])
-            simplices = submesh.connectivity
-            boundary_inds = np.array(
-                [np.where(submesh.vertex_inds == ind)[0][0] for ind in submesh_boundary.inds]
-            )
-            uac_coordinates = np.hstack(
-                (submesh_boundary.alpha[:, None], submesh_boundary.beta[:, None])
-            )
-            mvc_map = mvc.compute_mean_value_coordinates(
-                vertices, simplices, boundary_inds, uac_coordinates
-            )
-            uac_submesh = internal.UACSubmesh(
-                vertex_inds=submesh.vertex_inds,
-                connectivity=simplices,
-                cell_inds=submesh.cell_inds,
-                alpha=mvc_map[:, 0],
-                beta=mvc_map[:, 1],
-            )
+            vertices = points[submesh.vertex_inds]
+            submesh_inputs[key_sequence] = (vertices, submesh, submesh_boundary)
+
+        # Compute UACs, submeshes are independent of each other
+        if self._num_workers > 1:
+            with ProcessPoolExecutor(max_workers=self._num_workers) as executor:
+                futures = {
+                    key_sequence: executor.submit(_compute_uac_submesh, *inputs)
+                    for key_sequence, inputs in submesh_inputs.items()
+                }
+                uac_submeshes = {
+                    key_sequence: future.result() for key_sequence, future in futures.items()
+                }
+        else:
+            uac_submeshes = {
+                key_sequence: _compute_uac_submesh(*inputs)
+                for key_sequence, inputs in submesh_inputs.items()
+            }
+
+        for key_sequence, uac_submesh in uac_submeshes.items():
             dict_utils.set_dict_entry(key_sequence, self._uac_submesh_data, uac_submesh)
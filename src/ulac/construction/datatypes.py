@@ -0,0 +1,38 @@
+from dataclasses import dataclass
+
+import numpy as np
+
+
+# ==================================================================================================
+@dataclass
+class ParameterizedPath:
+    inds: np.ndarray = None
+    relative_lengths: np.ndarray = None
+
+
+@dataclass
+class UACPath(ParameterizedPath):
+    alpha: np.ndarray = None
+    beta: np.ndarray = None
+
+
+@dataclass
+class Submesh:
+    vertex_inds: np.ndarray = None
+    connectivity: np.ndarray = None
+    cell_inds: np.ndarray = None
+
+
+@dataclass
+class UACSubmesh(Submesh):
+    alpha: np.ndarray = None
+    beta: np.ndarray = None
+
+
+@dataclass
+class MeshTopology:
+    faces: np.ndarray = None
+    edges: np.ndarray = None
+    edge_lengths: np.ndarray = None
+    neighbor_face_offsets: np.ndarray = None
+    neighbor_faces: np.ndarray = None
@@ -1,42 +1,69 @@
-from dataclasses import dataclass
-
-import igraph as ig
 import numpy as np
 import pyvista as pv
-import trimesh as tm
-from numba import njit
-from numba.typed import List
-
-
-# ==================================================================================================
-@dataclass
-class ParameterizedPath:
-    inds: np.ndarray = None
-    relative_lengths: np.ndarray = None
-
+import scipy.sparse as sps
+from numba import njit, types
+from numba.typed import Dict
 
-@dataclass
-class UACPath(ParameterizedPath):
-    alpha: np.ndarray = None
-    beta: np.ndarray = None
+from .datatypes import MeshTopology, ParameterizedPath, Submesh, UACPath
 
 
-@dataclass
-class Submesh:
-    vertex_inds: np.ndarray = None
-    connectivity: np.ndarray = None
-    cell_inds: np.ndarray = None
+# ==================================================================================================
+def get_mesh_topology(mesh: pv.PolyData) -> MeshTopology:
+    faces = mesh.faces.reshape(-1, 4)[:, 1:4]
+    num_faces = faces.shape[0]
+    num_points = mesh.number_of_points
+
+    # Unique edges from sorted face edges, hashed into one int64 key per edge
+    face_edges = np.sort(faces[:, [0, 1, 1, 2, 2, 0]].reshape(-1, 2), axis=1).astype(np.int64)
+    face_edge_keys = face_edges[:, 0] * num_points + face_edges[:, 1]
+    edge_keys, face_edge_inds = np.unique(face_edge_keys, return_inverse=True)
+    edges = np.column_stack(np.divmod(edge_keys, num_points))
+    edge_lengths = np.linalg.norm(mesh.points[edges[:, 1]] - mesh.points[edges[:, 0]], axis=1)
+
+    # Faces are adjacent if they share a manifold edge, i.e. an edge with exactly two faces
+    edge_face_order = np.argsort(face_edge_inds, kind="stable")
+    edge_face_counts = np.bincount(face_edge_inds, minlength=edge_keys.size)
+    edge_face_offsets = np.cumsum(edge_face_counts) - edge_face_counts
+    manifold_edge_offsets = edge_face_offsets[edge_face_counts == 2]
+    first_faces = edge_face_order[manifold_edge_offsets] // 3
+    second_faces = edge_face_order[manifold_edge_offsets + 1] // 3
+
+    adjacency_rows = np.concatenate([first_faces, second_faces])
+    adjacency_cols = np.concatenate([second_faces, first_faces])
+    adjacency_matrix = sps.csr_matrix(
+        (np.ones(adjacency_rows.size, dtype=np.int8), (adjacency_rows, adjacency_cols)),
+        shape=(num_faces, num_faces),
+    )
+    mesh_topology = MeshTopology(
+        faces=faces.astype(np.int32),
+        edges=edges,
+        edge_lengths=edge_lengths,
+        neighbor_face_offsets=adjacency_matrix.indptr.astype(np.int32, copy=False),
+        neighbor_faces=adjacency_matrix.indices.astype(np.int32, copy=False),
+    )
+    return mesh_topology
 
 
-@dataclass
-class UACSubmesh(Submesh):
-    alpha: np.ndarray = None
-    beta: np.ndarray = None
+# --------------------------------------------------------------------------------------------------
+def get_geometry_boundary(mesh: pv.PolyData) -> np.ndarray:
+    geometry_boundaries = mesh.extract_feature_edges(
+        boundary_edges=True,
+        feature_edges=False,
+        manifold_edges=False,
+        non_manifold_edges=False,
+    )
+    geometry_boundary_inds = np.unique(geometry_boundaries.point_data["vtkOriginalPointIds"])
+    return geometry_boundary_inds
 
 
-# ==================================================================================================
+# --------------------------------------------------------------------------------------------------
 def get_feature_boundary(
-    mesh: pv.PolyData, feature_tag: int, coincides_with_geometry_boundary: bool
+    mesh: pv.PolyData,
+    feature_tag: int,
+    coincides_with_geometry_boundary: bool,
+    geometry_boundary_inds: np.ndarray | None = None,
+    *,
+    mesh_topology: MeshTopology | None = None,
 ) -> tuple[np.ndarray, np.ndarray]:
     feature_mesh = mesh.extract_values(feature_tag, scalars="anatomical_tags")
     feature_boundaries = feature_mesh.extract_feature_edges(
@@ -45,31 +72,60 @@ def get_feature_boundary(
         manifold_edges=False,
         non_manifold_edges=False,
     )
-    geometry_boundaries = mesh.extract_feature_edges(
-        boundary_edges=True,
-        feature_edges=False,
-        manifold_edges=False,
-        non_manifold_edges=False,
-    )
     feature_boundary_inds = feature_mesh.point_data["vtkOriginalPointIds"][
         feature_boundaries.point_data["vtkOriginalPointIds"]
     ]
-    geometry_boundary_inds = geometry_boundaries.point_data["vtkOriginalPointIds"]
+    if geometry_boundary_inds is None:
+        geometry_boundary_inds = get_geometry_boundary(mesh)
 
     if coincides_with_geometry_boundary:
-        feature_boundary_inds = np.intersect1d(feature_boundary_inds, geometry_boundary_inds)
+        feature_boundary_inds = _sorted_intersect(feature_boundary_inds, geometry_boundary_inds)
     else:
-        feature_boundary_inds = np.setdiff1d(feature_boundary_inds, geometry_boundary_inds)
+        feature_boundary_inds = _sorted_setdiff(feature_boundary_inds, geometry_boundary_inds)
 
-    ordered_boundary_inds = _construct_ordered_path_from_indices(mesh, feature_boundary_inds)
+    if mesh_topology is None:
+        mesh_topology = get_mesh_topology(mesh)
+    ordered_boundary_inds = _construct_ordered_path_from_indices(
+        mesh_topology.edges, feature_boundary_inds
+    )
     return ordered_boundary_inds
 
 
 # --------------------------------------------------------------------------------------------------
-def _construct_ordered_path_from_indices(mesh: pv.PolyData, path_indices: np.ndarray) -> np.ndarray:
-    tm_mesh = tm.Trimesh(mesh.points, mesh.faces.reshape(-1, 4)[:, 1:])
-    path_edges = tm_mesh.edges[np.isin(tm_mesh.edges, path_indices).all(axis=1)].flatten()
-    local_edges = np.array([np.where(path_indices == ind)[0][0] for ind in path_edges])
+def _sorted_intersect(values: np.ndarray, other_values: np.ndarray) -> np.ndarray:
+    unique_values = np.unique(values)
+    return unique_values[_is_in_sorted(unique_values, _sort_if_unsorted(other_values))]
+
+
+# --------------------------------------------------------------------------------------------------
+def _sorted_setdiff(values: np.ndarray, excluded_values: np.ndarray) -> np.ndarray:
+    unique_values = np.unique(values)
+    return unique_values[~_is_in_sorted(unique_values, _sort_if_unsorted(excluded_values))]
+
+
+# --------------------------------------------------------------------------------------------------
+def _sort_if_unsorted(values: np.ndarray) -> np.ndarray:
+    if np.all(values[1:] >= values[:-1]):
+        return values
+    return np.sort(values)
+
+
+# --------------------------------------------------------------------------------------------------
+def _is_in_sorted(values: np.ndarray, sorted_values: np.ndarray) -> np.ndarray:
+    if sorted_values.size == 0:
+        return np.zeros(values.size, dtype=bool)
+    positions = np.searchsorted(sorted_values, values)
+    positions = np.minimum(positions, sorted_values.size - 1)
+    return sorted_values[positions] == values
+
+
+# --------------------------------------------------------------------------------------------------
+def _construct_ordered_path_from_indices(edges: np.ndarray, path_indices: np.ndarray) -> np.ndarray:
+    import igraph as ig  # noqa: PLC0415 - deferred, igraph import dominates module load time
+
+    path_edges = edges[np.isin(edges, path_indices).all(axis=1)].flatten()
+    sorting_order = np.argsort(path_indices)
+    local_edges = sorting_order[np.searchsorted(path_indices[sorting_order], path_edges)]
     local_edges = local_edges.reshape(-1, 2)
     graph = ig.Graph(local_edges, directed=False)
     ordered_path, _ = graph.dfs(0)
@@ -77,69 +133,82 @@ def _construct_ordered_path_from_indices(mesh: pv.PolyData, path_indices: np.nda
 
 
 # --------------------------------------------------------------------------------------------------
-def construct_shortest_path_between_subsets(
+def construct_shortest_path_between_subsets(  # noqa: PLR0913 - mesh_topology is an optional cache
     mesh: pv.PolyData,
     subset_one: np.ndarray,
     subset_two: np.ndarray,
     inadmissible_contact_set: np.ndarray,
     inadmissible_along_set: np.ndarray,
+    *,
+    mesh_topology: MeshTopology | None = None,
 ):
-    tm_mesh = tm.Trimesh(vertices=mesh.points, faces=mesh.faces.reshape(-1, 4)[:, 1:])
-    edges = tm_mesh.edges_unique
-    edge_lengths = tm_mesh.edges_unique_length
-    inadmissible_contact_edges = np.where(np.isin(edges, inadmissible_contact_set).any(axis=1))[0]
-    inadmissible_along_edges = np.where(np.isin(edges, inadmissible_along_set).all(axis=1))[0]
-    inadmissible_edges = np.unique(
-        np.concatenate([inadmissible_contact_edges, inadmissible_along_edges])
-    )
-    admissible_edges = np.delete(edges, inadmissible_edges, axis=0)
-    admissible_edges_lengths = np.delete(edge_lengths, inadmissible_edges, axis=0)
-
-    graph = ig.Graph(admissible_edges, directed=False)
-    distances = np.array(graph.distances(subset_one, subset_two, weights=admissible_edges_lengths))
-    rel_start_point, rel_end_point = np.unravel_index(np.argmin(distances), distances.shape)
-    graph = ig.Graph(admissible_edges, directed=False)
-    shortest_path = np.array(
-        graph.get_shortest_paths(
-            subset_one[rel_start_point],
-            to=subset_two[rel_end_point],
-            weights=admissible_edges_lengths,
-        )[0]
+    import igraph as ig  # noqa: PLC0415 - deferred, igraph import dominates module load time
+
+    if mesh_topology is None:
+        mesh_topology = get_mesh_topology(mesh)
+    edges = mesh_topology.edges
+    edge_lengths = mesh_topology.edge_lengths
+    num_vertices = max(mesh.number_of_points, int(edges.max()) + 1)
+    is_contact_vertex = np.zeros(num_vertices, dtype=bool)
+    is_contact_vertex[inadmissible_contact_set] = True
+    is_along_vertex = np.zeros(num_vertices, dtype=bool)
+    is_along_vertex[inadmissible_along_set] = True
+    is_inadmissible_contact = is_contact_vertex[edges].any(axis=1)
+    is_inadmissible_along = is_along_vertex[edges].all(axis=1)
+    is_admissible = ~(is_inadmissible_contact | is_inadmissible_along)
+    admissible_edges = edges[is_admissible]
+    admissible_edges_lengths = edge_lengths[is_admissible]
+
+    # Connect both subsets to virtual terminal vertices, so that one Dijkstra run finds the
+    # shortest path between any pair of subset vertices
+    source_vertex = num_vertices
+    target_vertex = num_vertices + 1
+    source_edges = np.column_stack([np.full(subset_one.size, source_vertex), subset_one])
+    target_edges = np.column_stack([subset_two, np.full(subset_two.size, target_vertex)])
+    graph_edges = np.vstack([admissible_edges, source_edges, target_edges])
+    graph_edge_lengths = np.concatenate(
+        [admissible_edges_lengths, np.zeros(subset_one.size + subset_two.size)]
     )
-    return np.array(shortest_path, dtype=int)
+
+    graph = ig.Graph(n=num_vertices + 2, edges=graph_edges, directed=False)
+    shortest_path = graph.get_shortest_paths(
+        source_vertex, to=target_vertex, weights=graph_edge_lengths, output="vpath"
+    )[0]
+    return np.array(shortest_path[1:-1], dtype=int)
 
 
 # --------------------------------------------------------------------------------------------------
 def extract_region_from_boundary(
-    mesh: pv.PolyData, boundary_inds: np.ndarray, outside_inds: np.ndarray
+    mesh: pv.PolyData,
+    boundary_inds: np.ndarray,
+    outside_inds: np.ndarray,
+    *,
+    mesh_topology: MeshTopology | None = None,
 ) -> np.ndarray:
-    mesh_points_without_boundary = np.setdiff1d(np.arange(mesh.number_of_points), boundary_inds)
+    mesh_points_without_boundary = _sorted_setdiff(
+        np.arange(mesh.number_of_points), boundary_inds
+    )
     mesh_without_boundary = mesh.extract_points(mesh_points_without_boundary, adjacent_cells=False)
     submeshes = mesh_without_boundary.split_bodies()
-    coinciding_outside_inds = np.where(
+    contains_outside_point = np.any(
         submeshes[0].point_data["vtkOriginalPointIds"] == outside_inds[0]
-    )[0]
-    inside_mesh = submeshes[0] if coinciding_outside_inds.size == 0 else submeshes[1]
+    )
+    inside_mesh = submeshes[1] if contains_outside_point else submeshes[0]
     seed_point = inside_mesh.point_data["vtkOriginalPointIds"][0]
     seed_ind = np.where(np.isin(mesh.faces.reshape(-1, 4)[:, 1:4], seed_point).any(axis=1))[0][0]
 
-    tm_mesh = tm.Trimesh(vertices=mesh.points, faces=mesh.faces.reshape(-1, 4)[:, 1:4])
-    face_adjacency = tm_mesh.face_adjacency
-    face_adjacency_flipped = np.flip(face_adjacency, axis=1)
-    face_adjacency_complete = np.vstack([face_adjacency, face_adjacency_flipped])
-    sorting_mask = np.argsort(face_adjacency_complete[:, 0])
-    face_adjacency_sorted = face_adjacency_complete[sorting_mask]
-    _, new_face_start_inds = np.unique(face_adjacency_sorted[:, 0], return_index=True)
-    neighbor_faces = face_adjacency_sorted[:, 1]
+    if mesh_topology is None:
+        mesh_topology = get_mesh_topology(mesh)
     boundary_edges = np.hstack([boundary_inds[:-1, None], boundary_inds[1:, None]])
     boundary_edges = np.append(boundary_edges, [[boundary_inds[-1], boundary_inds[0]]], axis=0)
+    boundary_edges = boundary_edges.astype(np.int32)
 
     submesh_cell_inds = _extract_region_from_boundary(
-        tm_mesh.faces,
+        mesh_topology.faces,
         seed_ind,
         boundary_edges,
-        new_face_start_inds,
-        neighbor_faces,
+        mesh_topology.neighbor_face_offsets,
+        mesh_topology.neighbor_faces,
     )
     pv_submesh = mesh.extract_cells(submesh_cell_inds)
     vertex_inds = pv_submesh.point_data["vtkOriginalPointIds"]
@@ -155,41 +224,71 @@ def _extract_region_from_boundary(
     faces: np.ndarray,
     seed_ind: int,
     boundary_edges: np.ndarray,
-    new_face_start_inds: np.ndarray,
+    neighbor_face_offsets: np.ndarray,
     neighbor_faces: np.ndarray,
 ) -> np.ndarray:
-    visited_cells = np.zeros(new_face_start_inds.shape[0], dtype=np.bool_)
-    active_list = List([seed_ind])
-
-    while active_list:
-        current_cell_ind = active_list.pop()
+    num_cells = faces.shape[0]
+    visited_cells = np.zeros(num_cells, dtype=np.bool_)
+    active_queue = np.empty(num_cells, dtype=np.int32)
+    active_queue[0] = seed_ind
+    visited_cells[seed_ind] = True
+    queue_head = 0
+    queue_tail = 1
+    boundary_edge_keys = Dict.empty(key_type=types.int64, value_type=types.int8)
+    for boundary_edge in boundary_edges:
+        boundary_edge_keys[_pack_edge_key(boundary_edge[0], boundary_edge[1])] = 1
+
+    while queue_head < queue_tail:
+        current_cell_ind = active_queue[queue_head]
+        queue_head += 1
         current_cell = faces[current_cell_ind]
-        visited_cells[current_cell_ind] = True
-        start_ind = new_face_start_inds[current_cell_ind]
-        end_ind = (
-            new_face_start_inds[current_cell_ind + 1]
-            if current_cell_ind + 1 < new_face_start_inds.size
-            else neighbor_faces.size
-        )
+        start_ind = neighbor_face_offsets[current_cell_ind]
+        end_ind = neighbor_face_offsets[current_cell_ind + 1]
         for i in range(start_ind, end_ind):
             neighbor_cell_ind = neighbor_faces[i]
-            neighbor_cell = faces[neighbor_cell_ind]
-            shared_edge = np.intersect1d(current_cell, neighbor_cell)
-            for boundary_edge in boundary_edges:
-                if shared_edge[0] in boundary_edge and shared_edge[1] in boundary_edge:
-                    is_boundary = True
-                    break
-            else:
-                is_boundary = False
-            if not is_boundary and not visited_cells[neighbor_cell_ind]:
-                active_list.append(neighbor_cell_ind)
+            if visited_cells[neighbor_cell_ind]:
+                continue
+            shared_edge_start, shared_edge_end = _get_shared_edge(
+                current_cell, faces[neighbor_cell_ind]
+            )
+            shared_edge_key = _pack_edge_key(shared_edge_start, shared_edge_end)
+            if shared_edge_key not in boundary_edge_keys:
+                visited_cells[neighbor_cell_ind] = True
+                active_queue[queue_tail] = neighbor_cell_ind
+                queue_tail += 1
 
     return np.where(visited_cells)[0]
 
 
+# --------------------------------------------------------------------------------------------------
+@njit
+def _get_shared_edge(first_cell: np.ndarray, second_cell: np.ndarray) -> tuple[int, int]:
+    shared_edge_start = -1
+    shared_edge_end = -1
+    for vertex_ind in first_cell:
+        if (
+            vertex_ind == second_cell[0]
+            or vertex_ind == second_cell[1]
+            or vertex_ind == second_cell[2]
+        ):
+            if shared_edge_start == -1:
+                shared_edge_start = vertex_ind
+            elif shared_edge_end == -1:
+                shared_edge_end = vertex_ind
+    return shared_edge_start, shared_edge_end
+
+
+# --------------------------------------------------------------------------------------------------
+@njit
+def _pack_edge_key(first_vertex_ind: int, second_vertex_ind: int) -> int:
+    lower_ind = min(first_vertex_ind, second_vertex_ind)
+    upper_ind = max(first_vertex_ind, second_vertex_ind)
+    return (np.int64(lower_ind) << 32) | np.int64(upper_ind)
+
+
 # ==================================================================================================
 def parameterize_path(
-    mesh: pv.PolyData, path: np.ndarray, marker_inds: list[int], marker_values: list[float]
+    mesh: pv.PolyData, path: np.ndarray, marker_inds: list[int], marker_values: np.ndarray
 ) -> ParameterizedPath:
     reordered_path, relative_marker_inds = _reorder_path_by_markers(
         path, marker_inds, marker_values
@@ -204,51 +303,61 @@ def parameterize_path(
 def _reorder_path_by_markers(
     path: np.ndarray,
     marker_inds: list[int],
-    marker_values: list[float],
+    marker_values: np.ndarray,
 ) -> tuple[np.ndarray, list[int]]:
-    relative_start_ind_location = np.where(path == marker_inds[0])[0]
-    ordered_path = np.roll(path, -relative_start_ind_location)
-
-    relative_marker_inds = [np.where(ordered_path == ind)[0][0] for ind in marker_inds]
+    # Work with positions relative to the first marker modulo the path length, and only
+    # materialize the reordered path once its orientation is known
+    path_positions = _get_position_map(path)
+    start_position = path_positions[int(marker_inds[0])]
+    relative_marker_inds = [
+        (path_positions[int(ind)] - start_position) % path.size for ind in marker_inds
+    ]
+    position_offsets = np.arange(path.size)
     marker_ind_order = np.argsort(relative_marker_inds)
     marker_values_order = np.argsort(marker_values)
     if not np.array_equal(marker_ind_order, marker_values_order):
-        ordered_path = np.roll(np.flip(ordered_path), 1)
-        relative_marker_inds = [np.where(ordered_path == ind)[0][0] for ind in marker_inds]
+        relative_marker_inds = [(-ind) % path.size for ind in relative_marker_inds]
+        position_offsets = -position_offsets
+    ordered_path = path[(start_position + position_offsets) % path.size]
     return ordered_path, relative_marker_inds
 
 
+# --------------------------------------------------------------------------------------------------
+def _get_position_map(values: np.ndarray) -> dict[int, int]:
+    return {value: position for position, value in enumerate(values.tolist())}
+
+
 # --------------------------------------------------------------------------------------------------
 def _parameterize_by_relative_length(
-    mesh: pv.PolyData, path: np.ndarray, relative_marker_inds: list[int], marker_values: list[float]
+    mesh: pv.PolyData, path: np.ndarray, relative_marker_inds: list[int], marker_values: np.ndarray
 ) -> ParameterizedPath:
     coordinates = np.array(mesh.points[path])
     if 1.0 not in marker_values:
         path = np.append(path, path[0])
         relative_marker_inds = [*relative_marker_inds, path.size - 1]
-        marker_values = [*marker_values, 1.0]
+        marker_values = np.append(marker_values, 1.0)
         coordinates = np.append(coordinates, [coordinates[0]], axis=0)
-    edge_lengths = np.linalg.norm(coordinates[1:] - coordinates[:-1], axis=1)
-    cumulative_lengths = np.cumsum(edge_lengths)
-    cumulative_lengths = np.insert(cumulative_lengths, 0, 0.0)
-    segmented_points = np.zeros(path.size)
-
-    num_segments = len(relative_marker_inds) - 1
-    for i in range(num_segments):
-        start_ind = relative_marker_inds[i]
-        end_ind = relative_marker_inds[i + 1]
-        start_value = marker_values[i]
-        end_value = marker_values[i + 1]
-        shifted_cumulative_lengths = (
-            cumulative_lengths[start_ind : end_ind + 1] - cumulative_lengths[start_ind]
+    if np.any(np.diff(relative_marker_inds) <= 0):
+        raise ValueError(
+            f"Markers at path positions {relative_marker_inds} are not ordered consistently "
+            f"with their values {marker_values}"
         )
-        relative_lengths = (
-            start_value
-            + (end_value - start_value)
-            * shifted_cumulative_lengths
-            / shifted_cumulative_lengths[-1]
+    if relative_marker_inds[-1] != path.size - 1:
+        raise ValueError(
+            f"Last marker at path position {relative_marker_inds[-1]} does not cover the path "
+            f"end at position {path.size - 1}"
         )
-        segmented_points[start_ind : end_ind + 1] = relative_lengths
+    edge_lengths = np.linalg.norm(np.diff(coordinates, axis=0), axis=1)
+    cumulative_lengths = np.zeros(path.size)
+    np.cumsum(edge_lengths, out=cumulative_lengths[1:])
+    segmented_points = np.zeros(path.size)
+
+    # Interpolate linearly in arc length between consecutive markers
+    marker_lengths = cumulative_lengths[relative_marker_inds]
+    covered_section = slice(relative_marker_inds[0], relative_marker_inds[-1] + 1)
+    segmented_points[covered_section] = np.interp(
+        cumulative_lengths[covered_section], marker_lengths, marker_values
+    )
 
     parameterized_path = ParameterizedPath(path, segmented_points)
     return parameterized_path
@@ -257,39 +366,44 @@ def _parameterize_by_relative_length(
 # ==================================================================================================
 def compute_uacs_polyline(
     path: ParameterizedPath,
-    segment_points: list[float],
-    segment_uacs: list[tuple[float, float]],
+    segment_points: np.ndarray,
+    segment_uacs: np.ndarray,
 ) -> UACPath:
-    alpha_values, beta_values, ind_values, relative_lengths = [], [], [], []
-    num_segments = len(segment_points) - 1
-
-    for i in range(num_segments):
-        start_ind = np.where(np.isclose(path.relative_lengths, segment_points[i]))[0][0]
-        end_ind = np.where(np.isclose(path.relative_lengths, segment_points[i + 1]))[0][0]
-        segment_inds = path.inds[start_ind : end_ind + 1]
-        start_uacs = segment_uacs[i]
-        end_uacs = segment_uacs[i + 1]
-        path_segment = path.relative_lengths[start_ind : end_ind + 1]
-        length_range = np.max(path_segment) - np.min(path_segment)
-        scaled_length = (path_segment - np.min(path_segment)) / length_range
-        alpha = start_uacs[0] + (end_uacs[0] - start_uacs[0]) * scaled_length
-        beta = start_uacs[1] + (end_uacs[1] - start_uacs[1]) * scaled_length
-
-        if i < num_segments - 1:
-            alpha = alpha[:-1]
-            beta = beta[:-1]
-            segment_inds = segment_inds[:-1]
-            path_segment = path_segment[:-1]
-        alpha_values.append(alpha)
-        beta_values.append(beta)
-        ind_values.append(segment_inds)
-        relative_lengths.append(path_segment)
-
-    ind_values = np.concatenate(ind_values)
-    relative_lengths = np.concatenate(relative_lengths)
-    alpha_values = np.concatenate(alpha_values)
-    beta_values = np.concatenate(beta_values)
+    # Relative lengths are monotonic, find first entries within isclose tolerance by bisection
+    _check_monotonic_relative_lengths(path)
+    boundary_points = segment_points[[0, -1]]
+    tolerances = 1e-8 + 1e-5 * np.abs(boundary_points)
+    boundary_inds = np.searchsorted(path.relative_lengths, boundary_points - tolerances)
+    boundary_inds = np.minimum(boundary_inds, path.relative_lengths.size - 1)
+    start_ind, end_ind = boundary_inds
+    if not np.isclose(path.relative_lengths[boundary_inds], boundary_points).all():
+        raise ValueError(f"Segment points {boundary_points} not found on parameterized path")
+    ind_values = path.inds[start_ind : end_ind + 1]
+    relative_lengths = path.relative_lengths[start_ind : end_ind + 1]
+    alpha_values = np.interp(relative_lengths, segment_points, segment_uacs[:, 0])
+    beta_values = np.interp(relative_lengths, segment_points, segment_uacs[:, 1])
     uac_path = UACPath(
         inds=ind_values, relative_lengths=relative_lengths, alpha=alpha_values, beta=beta_values
     )
     return uac_path
+
+
+# --------------------------------------------------------------------------------------------------
+def extract_uac_path_portion(path: UACPath, portion: tuple[float, float]) -> UACPath:
+    _check_monotonic_relative_lengths(path)
+    section_start = np.searchsorted(path.relative_lengths, portion[0], side="left")
+    section_end = np.searchsorted(path.relative_lengths, portion[1], side="right")
+    relevant_section = slice(section_start, section_end)
+    uac_path_portion = UACPath(
+        inds=path.inds[relevant_section],
+        relative_lengths=path.relative_lengths[relevant_section],
+        alpha=path.alpha[relevant_section],
+        beta=path.beta[relevant_section],
+    )
+    return uac_path_portion
+
+
+# --------------------------------------------------------------------------------------------------
+def _check_monotonic_relative_lengths(path: ParameterizedPath) -> None:
+    if np.any(np.diff(path.relative_lengths) < 0):
+        raise ValueError("Relative lengths of parameterized path are not monotonically increasing")
@@ -0,0 +1,51 @@
+import pytest
+
+from ulac.construction import configuration
+
+
+# ==================================================================================================
+@pytest.mark.unit
+def test_configs_built_from_lists_are_hashable() -> None:
+    configs = (
+        configuration.MarkerConfig(["path", "a"], "index", 0),
+        configuration.ParameterizationConfig(["path", "a"], [["marker", "a"]], [0, 1]),
+        configuration.ConnectionPathConfig(
+            ["marker", "path"], ["marker", "a"], ["path", "b"], [["path", "c"]]
+        ),
+        configuration.UACConfig(["path", "a"], [0, 1], [[0, 0], [1, 1]]),
+        configuration.SubmeshConfig([["path", "a"]], [[0, 1]], ["path", "b"]),
+    )
+    for config in configs:
+        hash(config)
+
+
+@pytest.mark.unit
+def test_marker_config_converts_position_type_names() -> None:
+    marker_config = configuration.MarkerConfig(("path",), "relative", 0.5)
+    assert marker_config.position_type is configuration.PositionType.RELATIVE
+    with pytest.raises(ValueError, match="Unknown position_type"):
+        configuration.MarkerConfig(("path",), "absolute", 0.5)
+
+
+# --------------------------------------------------------------------------------------------------
+@pytest.mark.unit
+@pytest.mark.parametrize("marker_relative_positions", [(0, 0.5, 0.5), (0, 0.75, 0.5)])
+def test_parameterization_config_rejects_non_increasing_positions(
+    marker_relative_positions: tuple[float, ...],
+) -> None:
+    with pytest.raises(ValueError, match="not strictly increasing"):
+        configuration.ParameterizationConfig(
+            ("path",), (("a",), ("b",), ("c",)), marker_relative_positions
+        )
+
+
+@pytest.mark.unit
+def test_uac_config_rejects_non_increasing_positions() -> None:
+    with pytest.raises(ValueError, match="not strictly increasing"):
+        configuration.UACConfig(("path",), (0.5, 0.25), ((0, 0), (1, 1)))
+
+
+@pytest.mark.unit
+def test_submesh_config_rejects_reversed_portions() -> None:
+    with pytest.raises(ValueError, match="has start after end"):
+        configuration.SubmeshConfig((("a",), ("b",)), ((0, 1), (0.75, 0.25)), ("c",))
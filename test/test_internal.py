@@ -0,0 +1,158 @@
+import numpy as np
+import pytest
+import pyvista as pv
+
+from ulac.construction import datatypes, internal
+
+
+# ==================================================================================================
+@pytest.fixture
+def line_mesh() -> pv.PolyData:
+    points = np.array([[0, 0, 0], [1, 0, 0], [3, 0, 0], [4, 0, 0], [8, 0, 0]], dtype=np.float64)
+    return pv.PolyData(points)
+
+
+@pytest.fixture
+def square_mesh() -> pv.PolyData:
+    points = np.array([[0, 0, 0], [1, 0, 0], [1, 1, 0], [0, 1, 0]], dtype=np.float64)
+    return pv.PolyData(points)
+
+
+@pytest.fixture
+def uac_path() -> datatypes.UACPath:
+    return datatypes.UACPath(
+        inds=np.array([10, 11, 12, 13, 14]),
+        relative_lengths=np.array([0.0, 0.25, 0.5, 0.75, 1.0]),
+        alpha=np.array([0.0, 0.1, 0.2, 0.3, 0.4]),
+        beta=np.array([1.0, 1.1, 1.2, 1.3, 1.4]),
+    )
+
+
+# ==================================================================================================
+@pytest.mark.unit
+def test_reorder_path_by_markers_rolls_to_first_marker() -> None:
+    path = np.array([5, 6, 7, 8, 9])
+    ordered_path, relative_marker_inds = internal._reorder_path_by_markers(
+        path, [7, 9], np.array([0.0, 0.5])
+    )
+    assert np.array_equal(ordered_path, [7, 8, 9, 5, 6])
+    assert relative_marker_inds == [0, 2]
+
+
+@pytest.mark.unit
+def test_reorder_path_by_markers_reverses_orientation() -> None:
+    path = np.array([5, 6, 7, 8, 9])
+    ordered_path, relative_marker_inds = internal._reorder_path_by_markers(
+        path, [7, 6, 9], np.array([0.0, 0.25, 0.5])
+    )
+    assert np.array_equal(ordered_path, [7, 6, 5, 9, 8])
+    assert relative_marker_inds == [0, 1, 3]
+
+
+# --------------------------------------------------------------------------------------------------
+@pytest.mark.unit
+def test_parameterize_open_path_by_relative_length(line_mesh: pv.PolyData) -> None:
+    path = np.arange(5)
+    parameterized_path = internal._parameterize_by_relative_length(
+        line_mesh, path, [0, 4], np.array([0.0, 1.0])
+    )
+    assert np.array_equal(parameterized_path.inds, path)
+    assert np.allclose(parameterized_path.relative_lengths, [0, 1 / 8, 3 / 8, 1 / 2, 1])
+
+
+@pytest.mark.unit
+def test_parameterize_open_path_with_intermediate_marker(line_mesh: pv.PolyData) -> None:
+    parameterized_path = internal._parameterize_by_relative_length(
+        line_mesh, np.arange(5), [0, 2, 4], np.array([0.0, 0.5, 1.0])
+    )
+    assert np.allclose(parameterized_path.relative_lengths, [0, 1 / 6, 1 / 2, 0.6, 1])
+
+
+@pytest.mark.unit
+def test_parameterize_closed_path_appends_start_point(square_mesh: pv.PolyData) -> None:
+    parameterized_path = internal._parameterize_by_relative_length(
+        square_mesh, np.arange(4), [0, 2], np.array([0.0, 0.5])
+    )
+    assert np.array_equal(parameterized_path.inds, [0, 1, 2, 3, 0])
+    assert np.allclose(parameterized_path.relative_lengths, [0, 0.25, 0.5, 0.75, 1])
+
+
+@pytest.mark.unit
+def test_parameterize_path_rejects_end_marker_before_path_end(line_mesh: pv.PolyData) -> None:
+    with pytest.raises(ValueError, match="does not cover the path end"):
+        internal._parameterize_by_relative_length(
+            line_mesh, np.arange(5), [0, 2], np.array([0.0, 1.0])
+        )
+
+
+@pytest.mark.unit
+def test_parameterize_path_rejects_inconsistent_marker_order(line_mesh: pv.PolyData) -> None:
+    with pytest.raises(ValueError, match="not ordered consistently"):
+        internal._parameterize_by_relative_length(
+            line_mesh, np.arange(5), [0, 3, 2, 4], np.array([0.0, 0.25, 0.5, 1.0])
+        )
+
+
+@pytest.mark.unit
+def test_parameterize_path_matches_reordered_closed_path(square_mesh: pv.PolyData) -> None:
+    parameterized_path = internal.parameterize_path(
+        square_mesh, np.array([2, 3, 0, 1]), [1, 0, 2], np.array([0.0, 0.25, 0.75])
+    )
+    assert np.array_equal(parameterized_path.inds, [1, 0, 3, 2, 1])
+    assert np.allclose(parameterized_path.relative_lengths, [0, 0.25, 0.5, 0.75, 1])
+
+
+# ==================================================================================================
+@pytest.mark.unit
+def test_compute_uacs_polyline_interpolates_between_segment_points(
+    uac_path: datatypes.UACPath,
+) -> None:
+    segment_points = np.array([0.25, 0.5, 1.0])
+    segment_uacs = np.array([[0.0, 1.0], [1.0, 1.0], [1.0, 0.0]])
+    polyline = internal.compute_uacs_polyline(uac_path, segment_points, segment_uacs)
+    assert np.array_equal(polyline.inds, [11, 12, 13, 14])
+    assert np.allclose(polyline.relative_lengths, [0.25, 0.5, 0.75, 1.0])
+    assert np.allclose(polyline.alpha, [0.0, 1.0, 1.0, 1.0])
+    assert np.allclose(polyline.beta, [1.0, 1.0, 0.5, 0.0])
+
+
+@pytest.mark.unit
+def test_compute_uacs_polyline_rejects_missing_segment_point(uac_path: datatypes.UACPath) -> None:
+    with pytest.raises(ValueError, match="not found on parameterized path"):
+        internal.compute_uacs_polyline(
+            uac_path, np.array([0.3, 1.0]), np.array([[0.0, 0.0], [1.0, 1.0]])
+        )
+
+
+@pytest.mark.unit
+def test_compute_uacs_polyline_rejects_non_monotonic_path(uac_path: datatypes.UACPath) -> None:
+    uac_path.relative_lengths = np.array([0.0, 0.5, 0.25, 0.75, 1.0])
+    with pytest.raises(ValueError, match="not monotonically increasing"):
+        internal.compute_uacs_polyline(
+            uac_path, np.array([0.0, 1.0]), np.array([[0.0, 0.0], [1.0, 1.0]])
+        )
+
+
+# --------------------------------------------------------------------------------------------------
+@pytest.mark.unit
+def test_extract_uac_path_portion_includes_both_bounds(uac_path: datatypes.UACPath) -> None:
+    uac_path_portion = internal.extract_uac_path_portion(uac_path, (0.25, 0.75))
+    assert np.array_equal(uac_path_portion.inds, [11, 12, 13])
+    assert np.array_equal(uac_path_portion.relative_lengths, [0.25, 0.5, 0.75])
+    assert np.array_equal(uac_path_portion.alpha, [0.1, 0.2, 0.3])
+    assert np.array_equal(uac_path_portion.beta, [1.1, 1.2, 1.3])
+
+
+@pytest.mark.unit
+def test_extract_uac_path_portion_between_vertices(uac_path: datatypes.UACPath) -> None:
+    uac_path_portion = internal.extract_uac_path_portion(uac_path, (0.3, 0.7))
+    assert np.array_equal(uac_path_portion.inds, [12])
+
+
+@pytest.mark.unit
+def test_extract_uac_path_portion_rejects_non_monotonic_path(
+    uac_path: datatypes.UACPath,
+) -> None:
+    uac_path.relative_lengths = np.array([0.0, 0.25, 0.5, 1.0, 0.75])
+    with pytest.raises(ValueError, match="not monotonically increasing"):
+        internal.extract_uac_path_portion(uac_path, (0.0, 1.0))